@@ -1,3 +1,6 @@
+import concurrent.futures
+import multiprocessing
+
 import axelrod as axl   # type: ignore
 from popcore.population import Population
 
@@ -12,17 +15,48 @@ def main():
         axl.Bully()
     ]
 
-    with Population() as pop:
+    # Most of the strategies above are deterministic, so a pairing plays
+    # out identically in every generation. Sharing one cache across all
+    # tournaments replays each deterministic match only once.
+    cache = axl.DeterministicCache()
+
+    # Strategy __str__ does formatting work; resolve every name once
+    # instead of re-formatting per generation.
+    player_names = [str(p) for p in players]
+
+    def commit_replacement(pop, branch, player):
+        # Only the losing slot changed this generation; committing
+        # the unchanged branches again would just duplicate their
+        # current player.
+        pop.checkout(branch)
+        pop.commit(player)
+
+    with Population() as pop, \
+            concurrent.futures.ThreadPoolExecutor(1) as executor:
         branches = [
-            pop.branch(str(p)) for p in players]
+            pop.branch(name) for name in player_names]
 
         for player, branch in zip(players, branches):
             pop.checkout(branch)
             pop.commit(player)
 
+        pending = None
         for i in range(7):
-            tournament = axl.Tournament(players)
-            results = tournament.play()
+            tournament = axl.Tournament(
+                players, deterministic_cache=cache
+            )
+            # Matches within a round-robin are independent, so spread
+            # them across every available core instead of replaying
+            # them one by one. The previous generation's commit runs
+            # on the executor in the meantime; join it before touching
+            # the population again.
+            results = tournament.play(
+                processes=multiprocessing.cpu_count(),
+                progress_bar=False
+            )
+
+            if pending is not None:
+                pending.result()
 
             first = results.ranking[0]
             last = results.ranking[-1]
@@ -30,13 +64,17 @@ def main():
             pop.checkout(branches[first])
 
             branches[last] = pop.branch(
-                str(players[first]) + str(i)
+                player_names[first] + str(i)
             )
             players[last] = players[first]
+            player_names[last] = player_names[first] + str(i)
+
+            pending = executor.submit(
+                commit_replacement, pop, branches[last], players[last]
+            )
 
-            for player, branch in zip(players, branches):
-                pop.checkout(branch)
-                pop.commit(player)
+        if pending is not None:
+            pending.result()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 
 from typing import Any, Dict
+import concurrent.futures
 import os
 import torch
 
@@ -15,6 +16,10 @@ class PersitenceHook(PostCommitHook):
     ) -> None:
         super().__init__()
         self._save_every = save_every
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1
+        )
+        self._pending = []
 
     def _post(
         self, population: Population, player: Player,
@@ -25,12 +30,50 @@ class PersitenceHook(PostCommitHook):
         """
         if timestep % self._save_every == 0:
             path = os.path.join(population.stage(), player.id)
-            torch.save(
-                {
-                    'agent': parameters['agent'].state_dict(),
-                    'optimizer': parameters['optimizer'].state_dict()
+
+            # Snapshot the state dicts synchronously so training does
+            # not race the background write: both the agent weights
+            # and the optimizer state tensors (exp_avg and friends are
+            # mutated in place by optimizer.step()) are copied to the
+            # CPU before the handoff. copy=True forces a real copy
+            # even for tensors already on the CPU, and the blocking
+            # transfer means the device-to-host copy has completed by
+            # the time the worker sees the tensors. Only the blocking
+            # torch.save goes to the worker thread; the legacy
+            # (zipfile-less) format skips the per-save CRC pass over
+            # the whole payload.
+            def snapshot(value):
+                if torch.is_tensor(value):
+                    return value.detach().to('cpu', copy=True)
+                return value
+
+            optimizer = parameters['optimizer'].state_dict()
+            state = {
+                'agent': {
+                    k: snapshot(v)
+                    for k, v in parameters['agent'].state_dict().items()
+                },
+                'optimizer': {
+                    'state': {
+                        idx: {k: snapshot(v) for k, v in bucket.items()}
+                        for idx, bucket in optimizer['state'].items()
+                    },
+                    'param_groups': optimizer['param_groups'],
                 },
-                path
+            }
+            self._pending.append(
+                self._executor.submit(
+                    torch.save, state, path,
+                    _use_new_zipfile_serialization=False
+                )
             )
             player.persisted = path
         return player
+
+    def flush(self):
+        """
+            Blocks until every queued checkpoint has reached disk.
+        """
+        for future in self._pending:
+            future.result()
+        self._pending.clear()
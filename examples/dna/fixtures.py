@@ -2,17 +2,31 @@
 # tests on them
 
 from popcore.population import Population
-import random
+
+import numpy as np
+
+try:
+    from numba import njit      # type: ignore
+except ImportError:             # numba is optional; fall back to pure python
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+        return decorate
 
 # TODO: @Szacquer document this example.
 
 
+@njit(cache=True)
+def _mutate(dna_buf, spot, letter_code):
+    """Mutate a strand of DNA in place (single uint8 store)."""
+    dna_buf[spot] = letter_code
+
+
 def mutate(parent_parameters, hyperparameters, contributors=[]):
     """Mutate a strand of DNA (replace a character in the str at random)"""
-    next_dna = list(parent_parameters)
-    next_dna[hyperparameters["spot"]] = hyperparameters["letter"]
-    next_dna = ''.join(next_dna)
-    return next_dna, hyperparameters
+    next_dna = bytearray(parent_parameters, 'ascii')
+    next_dna[hyperparameters["spot"]] = ord(hyperparameters["letter"])
+    return next_dna.decode('ascii'), hyperparameters
 
 
 def random_linear_dna_evolution():
@@ -20,20 +34,33 @@ def random_linear_dna_evolution():
     of only a single lineage"""
     pop = Population()
 
-    next_dna = "OOOOO"
-    dna_history = [next_dna]
+    # Keep the DNA as a uint8 buffer so a mutation is an in-place store
+    # rather than a str -> list -> str round-trip; decode only at commit
+    # time.
+    dna_buf = np.frombuffer(b"OOOOO", dtype=np.uint8).copy()
+    dna_history = [bytes(dna_buf).decode()]
+
+    pop.commit(parameters=dna_history[0])
 
-    pop.commit(parameters=next_dna)
+    # Draw all 16 (spot, letter) pairs in two vectorized calls instead
+    # of two python-level RNG calls per iteration.
+    rng = np.random.default_rng()
+    spots = rng.integers(0, len(dna_buf), size=16)
+    letters = "ACGT"
+    letter_codes = np.frombuffer(
+        letters.encode(), dtype=np.uint8
+    )[rng.integers(0, len(letters), size=16)]
 
     for x in range(16):
-        letter = random.choice("ACGT")
-        spot = random.randrange(len(next_dna))
+        letter = chr(letter_codes[x])
+        spot = int(spots[x])
 
-        hyperparameters = {"letter": letter, "spot": spot}
-        next_dna, _ = mutate(next_dna, hyperparameters)
+        _mutate(dna_buf, spot, letter_codes[x])
+        next_dna = bytes(dna_buf).decode()
         dna_history.append(next_dna)
 
-        pop.commit(parameters=next_dna, hyperparameters=hyperparameters)
+        pop.commit(parameters=next_dna,
+                   hyperparameters={"letter": letter, "spot": spot})
 
     return pop, dna_history
 
@@ -1,48 +1,98 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from itertools import combinations
 from typing import (
-    Any, Generic, Iterable, List,
+    Any, Generic, Iterable, Iterator, List,
     Optional, TypeVar, Union
 )
 import numpy as np
 
+from .errors import (
+    POPULATION_PLAYER_EXISTS, POPULATION_PLAYER_NOT_EXIST
+)
+
 
 GameOutcome = TypeVar("GameOutcome")
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """
         Player abstraction
     """
     id: str
+    _repr: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # Interned ids hash once and let dict probes short-circuit on
+        # identity instead of comparing full strings.
+        if type(self.id) is str:
+            self.id = sys.intern(self.id)
 
     def __eq__(self, other: 'Player') -> bool:
         return self.id == other.id
 
+    def __hash__(self) -> int:
+        return hash(self.id)
+
     def __str__(self) -> str:
         return self.id
 
     def __repr__(self) -> str:
-        return f"Player(id={self.id})"
+        # The id never changes, so format the repr once.
+        if self._repr is None:
+            self._repr = f"Player(id={self.id})"
+        return self._repr
 
 
 PlayerLike = Union[Player, str]
 PlayerType = TypeVar("PlayerType", bound=PlayerLike)
 
 
-@dataclass
+def _player_uid(player: PlayerLike) -> str:
+    return player if isinstance(player, str) else player.id
+
+
+@dataclass(slots=True)
 class Coalition(Player):
     """
        A coalition is a collection of players that act together.
     """
-    members: list[Player]
+    members: 'tuple[Player, ...]'
+    _member_ids: Optional[Any] = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        # Explicit base call: zero-argument super() breaks inside a
+        # dataclass recreated by slots=True.
+        Player.__post_init__(self)
+        # A fixed-size tuple is smaller and iteration-friendlier than a
+        # list for a roster that never changes after construction.
+        if not isinstance(self.members, tuple):
+            self.members = tuple(self.members)
+
+    @property
+    def member_ids(self) -> np.ndarray:
+        """
+            Returns the member ids as an object ndarray, built once, so
+            outcome credit can be broadcast across the whole coalition
+            in a single scatter.
+
+        :return: A numpy array with the ids of the members.
+        :rtype: np.ndarray
+        """
+        if self._member_ids is None:
+            self._member_ids = np.fromiter(
+                (member.id for member in self.members),
+                dtype=object, count=len(self.members)
+            )
+        return self._member_ids
 
     def __repr__(self) -> str:
         return f"Coalition({str([player for player in self.members])})"
 
 
-@dataclass
 class Interaction(Generic[GameOutcome]):
     """
         Records an interaction between players, and each
@@ -52,39 +102,48 @@ class Interaction(Generic[GameOutcome]):
         outcomes: outcomes for each player involved in the game
     """
 
+    __slots__ = ('_players', '_outcomes', '_order', '_pairwise')
+
     def __init__(
         self, players: Iterable[PlayerLike], outcomes: Iterable[GameOutcome]
     ):
-        self._players = np.array(players)
-        self._outcomes = np.array(outcomes)
+        self._players = (
+            players if isinstance(players, tuple) else tuple(players)
+        )
+        self._outcomes = (
+            outcomes if isinstance(outcomes, tuple) else tuple(outcomes)
+        )
+
+        self._order = len(self._players)
 
         # TODO: exception handling
-        if self._players.shape[-1] < 2:
+        if self._order < 2:
             raise ValueError("interaction.at_leastpairwise")
 
         # TODO: exception handling
-        if self._players.shape != self._outcomes.shape:
+        if self._order != len(self._outcomes):
             raise ValueError("interaction.same_shape")
 
+        self._pairwise: 'Optional[List[Interaction]]' = None
+
     @property
     def players(self) -> List[Player]:
-        return self._players.tolist()
+        return list(self._players)
 
     @property
     def outcomes(self) -> List[GameOutcome]:
-        return self._outcomes.tolist()
+        return list(self._outcomes)
 
     def __repr__(self) -> str:
-        repr = [
+        repr = ", ".join(
             f"{p}:{o}"
-            for p, o in zip(self.players, self.outcomes)
-        ]
-        repr = ", ".join(repr)
+            for p, o in zip(self._players, self._outcomes)
+        )
         return f"Interaction({repr})"
 
     @property
     def order(self) -> int:
-        return self._players.shape[-1]
+        return self._order
 
     def to_pairwise(self) -> 'List[Interaction]':
         """
@@ -101,21 +160,78 @@ class Interaction(Generic[GameOutcome]):
         if self.order == 2:
             return [self]
 
+        if self._pairwise is not None:
+            return self._pairwise
+
         interactions = []
         for player, opponent in combinations(
-            zip(self.players, self.outcomes), 2
+            zip(self._players, self._outcomes), 2
         ):
             players, outcomes = zip(player, opponent)
             interactions.append(
                 Interaction(players, outcomes)
             )
 
+        self._pairwise = interactions
         return interactions
 
+    @classmethod
+    def from_batches(
+        cls,
+        players_batch: Iterable[Iterable[PlayerLike]],
+        outcomes_batch: Iterable[Iterable[GameOutcome]]
+    ) -> 'List[Interaction[GameOutcome]]':
+        """
+           Bulk constructor for a rectangular batch of interactions.
+
+           The shared shape is validated once up front; instances are
+           then built by direct slot assignment, bypassing the per
+           instance checks in __init__.
+
+        :param players_batch: one row of players per interaction.
+        :param outcomes_batch: one row of outcomes per interaction,
+            with the same shape as players_batch.
+        :raises ValueError: if the batch is not rectangular of order
+            at least 2, or the two shapes differ.
+        :return: the list of constructed interactions.
+        :rtype: List[Interaction]
+        """
+        # Materialize the rows first: np.shape on a generator is (),
+        # which would reject valid input, and the tuples are what the
+        # instances store anyway.
+        players_batch = [tuple(row) for row in players_batch]
+        outcomes_batch = [tuple(row) for row in outcomes_batch]
+
+        shape = np.shape(players_batch)
+        if len(shape) != 2 or shape[-1] < 2:
+            raise ValueError("interaction.at_leastpairwise")
+        if shape != np.shape(outcomes_batch):
+            raise ValueError("interaction.same_shape")
+
+        order = shape[-1]
+        interactions = []
+        append = interactions.append
+        for players, outcomes in zip(players_batch, outcomes_batch):
+            interaction = cls.__new__(cls)
+            interaction._players = players
+            interaction._outcomes = outcomes
+            interaction._order = order
+            interaction._pairwise = None
+            append(interaction)
+
+        return interactions
+
+    def _as_arrays(self) -> 'tuple[np.ndarray, np.ndarray]':
+        """
+           Converts the stored players/outcomes tuples into numpy
+           arrays, for the few consumers that need ndarray semantics.
+        """
+        return np.asarray(self._players), np.asarray(self._outcomes)
+
     def __eq__(self, other: 'Interaction') -> bool:
         return (
-            np.array_equal(self._players, other._players) and
-            np.array_equal(self._outcomes, other._outcomes)
+            self._players == other._players and
+            self._outcomes == other._outcomes
         )
 
 
@@ -124,10 +240,16 @@ class History(Generic[GameOutcome]):
     def __init__(
         self, interactions: Iterable[Interaction[GameOutcome]]
     ):
-        self._interactions = interactions
+        # Materialize once: generators would otherwise be drained by
+        # the population build below and silently break iteration.
+        self._interactions = (
+            interactions if isinstance(interactions, tuple)
+            else tuple(interactions)
+        )
         self._population = Population.from_players_interactions(
-            interactions
+            self._interactions
         )
+        self._indices: 'Optional[tuple[np.ndarray, np.ndarray]]' = None
 
     @property
     def players(self) -> List[Player]:
@@ -138,10 +260,117 @@ class History(Generic[GameOutcome]):
         :return: list of players in the interactions.
         :rtype: List[Player]
         """
-        return list(self._population.players)
+        return self._population.players.tolist()
 
-    def __iter__(self) -> Iterable[Interaction[GameOutcome]]:
-        return self._interactions
+    def __iter__(self) -> Iterator[Interaction[GameOutcome]]:
+        return iter(self._interactions)
+
+    def _pairwise_indices(self) -> 'tuple[np.ndarray, np.ndarray]':
+        """
+           Flattens the (pairwise decompositions of the) interactions
+           into two parallel arrays: linearized (row, col) indices into
+           the payoff matrix and the corresponding outcomes. Built once
+           and reused by every reduction.
+        """
+        if self._indices is not None:
+            return self._indices
+
+        population = self._population
+        size = population.size
+
+        pairwise = [
+            pair
+            for interaction in self._interactions
+            for pair in interaction.to_pairwise()
+        ]
+
+        count = len(pairwise)
+        idx0 = np.fromiter(
+            (population[_player_uid(pair.players[0])] for pair in pairwise),
+            dtype=np.int32, count=count
+        )
+        idx1 = np.fromiter(
+            (population[_player_uid(pair.players[1])] for pair in pairwise),
+            dtype=np.int32, count=count
+        )
+        out0 = np.fromiter(
+            (pair.outcomes[0] for pair in pairwise),
+            dtype=np.float32, count=count
+        )
+        out1 = np.fromiter(
+            (pair.outcomes[1] for pair in pairwise),
+            dtype=np.float32, count=count
+        )
+
+        flat = np.concatenate((idx0 * size + idx1, idx1 * size + idx0))
+        outcomes = np.concatenate((out0, out1))
+
+        self._indices = (flat, outcomes)
+        return self._indices
+
+    def to_payoff_matrix(self) -> np.ndarray:
+        """
+           Accumulates the interactions into a payoff matrix.
+
+           Entry (i, j) holds the total outcome obtained by player i
+           against player j over all (pairwise decompositions of the)
+           interactions. The accumulation is a single vectorized
+           bincount over linearized indices instead of a
+           per-interaction python loop.
+
+        :return: a square matrix of accumulated pairwise outcomes.
+        :rtype: np.ndarray
+        """
+        flat, outcomes = self._pairwise_indices()
+        size = self._population.size
+
+        payoffs = np.bincount(
+            flat, weights=outcomes, minlength=size * size
+        )
+
+        return payoffs.reshape(size, size).astype(np.float32)
+
+    def to_payoffs(self) -> np.ndarray:
+        """
+           Returns the matrix of average payoffs: entry (i, j) is the
+           mean outcome obtained by player i against player j. Pairs
+           that never interacted hold zero.
+
+        :return: a square matrix of average pairwise outcomes.
+        :rtype: np.ndarray
+        """
+        flat, outcomes = self._pairwise_indices()
+        size = self._population.size
+
+        sums = np.bincount(
+            flat, weights=outcomes, minlength=size * size
+        )
+        counts = np.bincount(flat, minlength=size * size)
+
+        payoffs = sums / np.maximum(counts, 1)
+        return payoffs.reshape(size, size).astype(np.float32)
+
+    def to_winrates(self) -> np.ndarray:
+        """
+           Returns the matrix of win rates: entry (i, j) is the
+           fraction of interactions in which player i obtained a
+           positive outcome against player j. Pairs that never
+           interacted hold zero.
+
+        :return: a square matrix of pairwise win rates.
+        :rtype: np.ndarray
+        """
+        flat, outcomes = self._pairwise_indices()
+        size = self._population.size
+
+        wins = np.bincount(
+            flat, weights=(outcomes > 0).astype(np.float32),
+            minlength=size * size
+        )
+        counts = np.bincount(flat, minlength=size * size)
+
+        winrates = wins / np.maximum(counts, 1)
+        return winrates.reshape(size, size).astype(np.float32)
 
     @classmethod
     def from_interactions(
@@ -159,7 +388,7 @@ class History(Generic[GameOutcome]):
         raise ValueError()  # TODO: exception raising.
 
 
-@dataclass
+@dataclass(slots=True)
 class TimedIntereaction(Interaction[GameOutcome]):
     timestep: int
 
@@ -186,8 +415,17 @@ class Population(Generic[PlayerType]):
 
         self.uid = uid
         self._players = dict[str, PlayerType]()
-        self._players_idx = dict[int, str]()
-        self._size: int = 0
+        self._players_idx = dict[str, int]()
+        # Players also live in parallel contiguous arrays (grown by
+        # doubling) so bulk operations can index them without a
+        # python-level pass over the dict.
+        self._capacity: int = 8
+        self._ids = np.empty(self._capacity, dtype=object)
+        self._array = np.empty(self._capacity, dtype=object)
+        # Parallel int32 columns for vectorized temporal filtering;
+        # players without the attributes land at zero.
+        self._generations = np.empty(self._capacity, dtype=np.int32)
+        self._timesteps = np.empty(self._capacity, dtype=np.int32)
         for player in players:
             self.aggregate(player)
 
@@ -199,10 +437,26 @@ class Population(Generic[PlayerType]):
                         The player identifier should be unique.
         :type player: Player
         """
-        assert player.id not in self._players
-        self._players[player.id] = player
-        self._players_idx[player.id] = self._size
-        self._size += 1
+        idx = len(self._players)
+        # setdefault probes the dict exactly once: a different object
+        # under the same id comes back, a re-aggregated object leaves
+        # the size unchanged.
+        existing = self._players.setdefault(player.id, player)
+        if existing is not player or len(self._players) == idx:
+            raise ValueError(POPULATION_PLAYER_EXISTS.format(player.id))
+        if idx == self._capacity:
+            self._capacity *= 2
+            self._ids = np.resize(self._ids, self._capacity)
+            self._array = np.resize(self._array, self._capacity)
+            self._generations = np.resize(
+                self._generations, self._capacity
+            )
+            self._timesteps = np.resize(self._timesteps, self._capacity)
+        self._ids[idx] = player.id
+        self._array[idx] = player
+        self._generations[idx] = getattr(player, 'generation', 0) or 0
+        self._timesteps[idx] = getattr(player, 'timestep', 0) or 0
+        self._players_idx[player.id] = idx
 
     @property
     def players(self) -> np.ndarray[Any, PlayerType]:
@@ -212,11 +466,37 @@ class Population(Generic[PlayerType]):
         :return: A numpy array with the players in the population.
         :rtype: np.ndarray[Any, PlayerType]
         """
-        return np.array([player for player in self._players.values()])
+        return self._array[:len(self._players)]
 
     @property
     def size(self):
-        return self._size
+        return len(self._players)
+
+    def at_generation(self, generation: int) -> np.ndarray:
+        """
+            Returns the players that belong to the given generation as
+            a single vectorized mask over the generation column.
+
+        :param generation: The generation to select.
+        :type generation: int
+        :return: A numpy array with the selected players.
+        :rtype: np.ndarray
+        """
+        size = len(self._players)
+        return self._array[:size][self._generations[:size] == generation]
+
+    def before_timestep(self, timestep: int) -> np.ndarray:
+        """
+            Returns the players recorded strictly before the given
+            timestep.
+
+        :param timestep: The exclusive upper bound on the timestep.
+        :type timestep: int
+        :return: A numpy array with the selected players.
+        :rtype: np.ndarray
+        """
+        size = len(self._players)
+        return self._array[:size][self._timesteps[:size] < timestep]
 
     def __iter__(self):
         return iter(self.players)
@@ -228,17 +508,25 @@ class Population(Generic[PlayerType]):
         return f"Population(id={self.uid})"
 
     def __getitem__(self, player_id: str) -> int:
-        assert player_id in self._players
-        return self._players_idx[player_id]
+        try:
+            return self._players_idx[player_id]
+        except KeyError:
+            raise ValueError(
+                POPULATION_PLAYER_NOT_EXIST.format(player_id)
+            ) from None
 
     def __contains__(self, player: PlayerType) -> bool:
         if isinstance(player, str):
             return player in self._players
 
-        if isinstance(player, Player):
-            return player in self.players
+        key = getattr(player, 'id', None)
+        if key is None:
+            raise TypeError(player)
 
-        raise ValueError()  # TODO: codify exception
+        existing = self._players.get(key)
+        return existing is not None and (
+            existing is player or existing == player
+        )
 
     @classmethod
     def from_players_uid(
@@ -255,8 +543,8 @@ class Population(Generic[PlayerType]):
         :return: A population containing a collection of players.
         :rtype: Population
         """
-        # TODO: implement exception handling here.
-        assert cls == Population, "Do not call from subclasses"
+        if cls is not Population:
+            raise TypeError("from_players_uid: do not call on subclasses")
         return Population[PlayerType](
             uid,
             [Player(player_id) for player_id in players_uid]
@@ -275,11 +563,18 @@ class Population(Generic[PlayerType]):
         :rtype: Population
         """
         population = Population(uid=uid, players=[])
+        seen = set()
+        seen_add = seen.add
+        aggregate = population.aggregate
         for interaction in interactions:
-            for player in interaction.players:
-                if isinstance(player, str):
-                    player = Player(player)
-                if player.id not in population:
-                    population.aggregate(player)
+            for player in interaction._players:
+                player_uid = _player_uid(player)
+                if player_uid in seen:
+                    continue
+                seen_add(player_uid)
+                aggregate(
+                    Player(player_uid) if isinstance(player, str)
+                    else player
+                )
 
         return population
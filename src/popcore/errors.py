@@ -10,3 +10,12 @@ POPUPLATION_BRANCH_EXISTS: str = """
 POPULATION_PLAYER_NOT_EXIST: str = """
    A player with name {0} does not exist."
 """
+
+POPULATION_PLAYER_EXISTS: str = """
+   A player with uid {0} already belongs to the population.
+"""
+
+POPULATION_BATCH_LENGTH_MISMATCH: str = """
+   commit_many requires one entry per commit in every column, got
+   {0} ids, {1} interactions and {2} timesteps.
+"""
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
-from typing import Generic, Iterable, List, Optional
+from typing import Generic, List, Optional
 
 from ._core import (
     Interaction, Population, PlayerType
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Operator:
     """
         operator(player0) -> player1
@@ -14,7 +14,7 @@ class Operator:
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EvolutionStep(Generic[PlayerType]):
     """
         player0 -- [operator] --> player1
@@ -38,9 +38,11 @@ class Lineage(Generic[PlayerType], Population[PlayerType]):
        evolutionary operator that given an initial policy/player.
     """
 
-    def __init__(self, uid: str, root: PlayerType):
-        super().__init__(uid, [root])
+    def __init__(self, uid: str, root: Optional[PlayerType]):
+        # _steps must exist before the base constructor aggregates the
+        # root, since aggregation dispatches back to this class.
         self._steps: List[EvolutionStep] = []
+        super().__init__(uid, [root] if root is not None else [])
 
     def aggregate(
         self, player: PlayerType, operator: Optional[Operator] = None,
@@ -99,6 +101,10 @@ class EvolutionTree(Generic[PlayerType], Population[PlayerType]):
         super().__init__(uid, [])
         self._lineages = dict[str,  Lineage[PlayerType]]()
         self._lineage: str = default_lineage_uid  # active lineage
+        # The active Lineage itself; keeping the reference makes head
+        # and tail single attribute loads instead of a dict lookup per
+        # access. Updated by lineage().
+        self._active_lineage: Lineage[PlayerType] = None
         self.lineage(default_lineage_uid)
 
     def aggregate(
@@ -115,7 +121,7 @@ class EvolutionTree(Generic[PlayerType], Population[PlayerType]):
         :param interaction: _description_, defaults to None
         :type interaction: Optional[Interaction], optional
         """
-        lineage = self._lineages[self._lineage]
+        lineage = self._active_lineage
 
         super().aggregate(player)
         lineage.aggregate(
@@ -127,21 +133,25 @@ class EvolutionTree(Generic[PlayerType], Population[PlayerType]):
             if not create_if_not_exist:
                 raise ValueError()  # TODO: codify exception
 
-            self._lineages[uid] = Lineage(uid, self.head)
+            # The very first lineage has no head to seed from.
+            seed = self._active_lineage.head \
+                if self._active_lineage is not None else None
+            self._lineages[uid] = Lineage(uid, seed)
 
         self._lineage = uid  # sets the active lineage to `uid`
-        return self._lineages[uid]
+        self._active_lineage = self._lineages[uid]
+        return self._active_lineage
 
     @property
     def head(self) -> PlayerType:
         """
             Returns the last player produced in the active lineage.
         """
-        return self.lineage(self._lineage).head
+        return self._active_lineage.head
 
     @property
     def tail(self) -> PlayerType:
         """
             Returns the seed (first) player produced in the active lineage.
         """
-        return self.lineage(self._lineages).tail
+        return self._active_lineage.tail
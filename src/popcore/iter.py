@@ -11,6 +11,80 @@ __all__ = [
 ]
 
 
+def _resolve(population: Population, name: str = None) -> Player:
+    """Resolves a commit or branch name to its node.
+
+        Args:
+            name (str): The name of the commit or branch to resolve.
+                Branch names resolve to the branch tip. If None,
+                returns the latest commit of the current branch.
+                Defaults to None.
+
+        Raises:
+            ValueError: If no commit or branch with the specified
+                `name` exists"""
+
+    if name is None:
+        return population._player
+
+    repo = population.repo
+    # Branch names live in the index alongside commit ids but have no
+    # object of their own; resolve them to their tip first, the same
+    # two-step checkout uses.
+    branches = repo._branches
+    if name in branches:
+        return repo.commit(branches.read(name))
+
+    if not repo.exists(name):
+        raise ValueError(POPULATION_PLAYER_NOT_EXIST.format(name))
+
+    return repo.commit(name)
+
+
+def _iter_lineage(
+    population: Population, name: str = None
+) -> Iterator[Player]:
+    """Yields the commits that came before the one with the specified
+    name, most recent first, up to and including _root.
+
+    The walk yields the nodes themselves, so consumers do not pay a
+    name -> node round-trip through the repository per commit."""
+
+    return _resolve(population, name).ancestors()
+
+
+def _iter_descendants(
+    population: Population, name: str = None
+) -> Iterator[Player]:
+    """Yields the given commit and every commit that originates from
+    it, in no particular order, without materializing intermediate
+    name lists."""
+
+    player = _resolve(population, name)
+
+    if population._frozen:
+        yield from population._frozen_descendants(player)
+        return
+
+    stack = [player]
+    # The visited set makes the walk robust to merged lineages: each
+    # node is yielded exactly once even if it is reachable through
+    # several parents.
+    visited = set()
+    # Hoist the bound methods out of the loop; the lookups add up over
+    # millions of nodes.
+    pop = stack.pop
+    extend = stack.extend
+    add = visited.add
+    while stack:
+        player = pop()
+        if player.id in visited:
+            continue
+        add(player.id)
+        yield player
+        extend(player.descendants or ())
+
+
 def _get_player(population: Population, name: str = None) -> Player:
     """Returns the commit with the given name if it exists.
 
@@ -22,13 +96,7 @@ def _get_player(population: Population, name: str = None) -> Player:
         Raises:
             ValueError: If a commit with the specified `name` does not exist"""
 
-    if name is None:
-        return population._player
-
-    if name not in population._objects:
-        raise ValueError(POPULATION_PLAYER_NOT_EXIST.format(name))
-
-    return population.repo.commit(name)
+    return _resolve(population, name)
 
 
 def _get_players(population: Population, names: List[str]) -> List[Player]:
@@ -39,11 +107,14 @@ def _get_players(population: Population, names: List[str]) -> List[Player]:
             get.
 
     Raises:
-        KeyError: If a commit with one of the specified id_str does not
-            exist
+        ValueError: If a commit with one of the specified id_str does
+            not exist
     """
 
-    return [_get_player(population, name) for name in names]
+    # One bound-method call per name: the per-name existence probe in
+    # _get_player would hash every id twice.
+    read = population.repo._objects.read
+    return list(map(read, names))
 
 
 def _get_ancesters(population: Population, name: str = None) -> List[str]:
@@ -60,22 +131,7 @@ def _get_ancesters(population: Population, name: str = None) -> List[str]:
     The list returned is in inverse chronological order, so the most
     recent commit appears first, and the oldest last."""
 
-    player: None | Player = None
-
-    if name is None:
-        player = population._player
-    else:
-        if not population.repo.exists(name):
-            raise ValueError(POPULATION_PLAYER_NOT_EXIST.format(name))
-        player = population.repo.commit(name)
-
-    history = [player.id]
-    player = player.parent
-    while player is not None:
-        history.append(player.id)
-        player = player.parent
-
-    return history
+    return [player.id for player in _iter_lineage(population, name)]
 
 
 def _get_descendents(population: Population, name: str = None) -> List[str]:
@@ -87,20 +143,7 @@ def _get_descendents(population: Population, name: str = None) -> List[str]:
 
     The list returned is in no particular order."""
 
-    player: None | Player  # Mypy cries if I don't specify that
-
-    if name is None:
-        player = population._player
-    else:
-        if not population.repo.exists(name):
-            raise ValueError(POPULATION_PLAYER_NOT_EXIST.format(name))
-        player = population.repo.commit(name)
-
-    history = [player.id]
-    for player in player.descendants:
-        history.extend(_get_descendents(population, player.id))
-
-    return history
+    return [player.id for player in _iter_descendants(population, name)]
 
 
 def lineage(population: Population, branch: str = None) -> Iterator[Player]:
@@ -115,25 +158,32 @@ def lineage(population: Population, branch: str = None) -> Iterator[Player]:
     Returns:
         Iterator[Player]: An iterator over all commits in the given branch"""
 
-    lineage = _get_ancesters(population, branch)[:-1]
-    for player in _get_players(population, lineage):
-        yield player
+    for player in _iter_lineage(population, branch):
+        # The root sentinel closes every lineage; it is not a commit.
+        if player.parent is not None:
+            yield player
 
 
-def generation(self, generation: int = -1) -> Iterator[Player]:
+def generation(
+    population: Population, generation: int = -1
+) -> Iterator[Player]:
     """Returns an iterator with the players in the given generation
 
     Args:
         population (Population): The population to iterate over.
 
-        gen (int): The generation to iterate over. Defaults to -1 (meaning the
-            last generation).
+        generation (int): The generation to iterate over. Defaults to -1
+            (meaning the last generation).
 
     Returns:
         Iterator[Player]: An iterator over all commits in the given generation
     """
 
-    raise NotImplementedError()
+    generations = population._generations
+    if generation == -1:
+        generation = max(generations, default=0)
+
+    return iter(generations.get(generation, ()))
 
 
 def flatten(population: Population) -> Iterator[Player]:
@@ -146,6 +196,6 @@ def flatten(population: Population) -> Iterator[Player]:
         Iterator[Player]: An iterator over all commits in the given population
     """
 
-    lineage = _get_descendents(population, population.head().id)[1:]
-    for player in _get_players(population, lineage):
-        yield player
+    descendants = _iter_descendants(population, population.head().id)
+    next(descendants)  # the head itself is not part of its descendants
+    yield from descendants
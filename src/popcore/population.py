@@ -1,10 +1,18 @@
-from dataclasses import dataclass
-from typing import Iterator, List, Optional, Set
-from hashlib import sha1
+import functools
+import os
+import struct
+import sys
+from array import array
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Set
+from hashlib import blake2b
+
+import numpy as np
 
 from .errors import (
     POPULATION_COMMIT_EXIST, POPUPLATION_BRANCH_EXISTS,
-    POPULATION_PLAYER_NOT_EXIST
+    POPULATION_PLAYER_NOT_EXIST, POPULATION_BATCH_LENGTH_MISMATCH
 )
 from ._core import Interaction, Player
 from .storage.repo import Repository, Hook
@@ -15,14 +23,19 @@ class PlayerKeyValueSerializer(Serializer[Player, dict]):
 
     def __init__(
         self,
-        exclude_fields: List[str] = ['descendants']
+        exclude_fields: Iterable[str] = (
+            'descendants', 'player', 'interaction',
+            '_ancestors', '_jumps', '_subtree', '_tips', '_idx', '_digest'
+        )
     ) -> None:
         super().__init__()
-        self._exclude_fields = exclude_fields
+        self._exclude_fields = frozenset(exclude_fields)
 
     def serialize(self, player: Player) -> dict:
+        # Nodes are slotted, so fields come from the dataclass rather
+        # than an instance __dict__.
         fields = {
-            k: v for k, v in player.__dict__.items()
+            k: getattr(player, k) for k in player.__dataclass_fields__
             if k not in self._exclude_fields
         }
         fields['parent'] = player.parent.id if player.parent else None
@@ -35,8 +48,43 @@ class PlayerKeyValueSerializer(Serializer[Player, dict]):
         return Player(**filtered)
 
 
+# Commit ids are in-process aliases, not objects exchanged over the
+# wire, so the default hash only needs speed and collision resistance.
+_default_hash = functools.partial(blake2b, digest_size=16)
+
+# Fixed-width packer for the node identity fed into the id hash.
+_pack_identity = struct.Struct('<Q').pack
+
+
+def _auto_id(player: 'MetaNode', hash_fn=_default_hash) -> str:
+    """Derives a unique commit id from the node's parent and identity.
+
+    The hash chains the parent's cached digest (falling back to
+    encoding the id for roots and user-named parents) with the node's
+    own identity, so per-commit hashing is a fixed ~24 bytes rather
+    than growing with id length or chain depth. BLAKE2b is
+    considerably faster than SHA-1/SHA-2 in software on these tiny
+    inputs, and 16 bytes is plenty of id space.
+
+    Args:
+        hash_fn: A hashlib-style constructor taking the bytes to
+            hash. Callers that need cryptographic ids can pass
+            hashlib.sha256 and the like."""
+
+    parent = player.parent
+    digest = hash_fn(parent._digest or parent.id.encode())
+    # Feeding the packed identity as a second update avoids building a
+    # concatenated buffer per commit; no conflicts between siblings.
+    digest.update(_pack_identity(id(player)))
+    player._digest = digest.digest()
+    return sys.intern(digest.hexdigest())
+
+
 class PlayerAutoIdHook(Hook):
 
+    def __init__(self, hash_fn=_default_hash) -> None:
+        self._hash_fn = hash_fn
+
     def __call__(
         self, repo: Repository, player: Player,
         *args, **kwds
@@ -44,34 +92,244 @@ class PlayerAutoIdHook(Hook):
         if player.id is not None:
             return player.id
 
-        parent = player.parent
-        path = parent.id + str(id(player))  # Avoid conflicts with siblings
-        player.id = sha1(path.encode()).hexdigest()
-        # player.path = f"{parent.path}/{player.id}"
+        player.id = _auto_id(player, self._hash_fn)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetaNode:
-    player: Player
-    parent: 'MetaNode'
-    descendants: List['MetaNode']
+    player: Optional[Player] = None
+    parent: 'Optional[MetaNode]' = None
+    # None until the first child: most nodes are leaves, and an empty
+    # list per leaf is pure overhead at population scale.
+    descendants: 'Optional[List[MetaNode]]' = None
     interaction: Optional[Interaction] = None
     generation: Optional[int] = 0
     timestep: Optional[int] = 1
     branch: Optional[str] = 0
     id: str = None
+    _ancestors: 'Optional[tuple]' = field(
+        default=None, init=False, repr=False
+    )
+    # Jump pointers to the ancestors 2^i generations up (binary lifting),
+    # populated by `add_descendant`. Entry 0 is the parent.
+    _jumps: 'List[MetaNode]' = field(
+        default_factory=list, init=False, repr=False
+    )
+    # Memoized flat views of the subtree below this node, cleared on
+    # every mutation underneath (see _clear_subtree_caches).
+    _subtree: 'Optional[tuple]' = field(default=None, init=False, repr=False)
+    _tips: 'Optional[tuple]' = field(default=None, init=False, repr=False)
+    # Position in the population's dense per-commit columns.
+    _idx: int = field(default=-1, init=False, repr=False)
+    # Chained id digest: each node hashes its parent's digest rather
+    # than re-encoding the parent's id string.
+    _digest: bytes = field(default=b'', init=False, repr=False)
 
     def __post_init__(self):
         if self.player is not None:
             self.id = self.player.id
+        elif type(self.id) is str:
+            # Interned ids make the index lookups on the commit path
+            # pointer comparisons; same idiom as Player.
+            self.id = sys.intern(self.id)
+
+    def path_to_root(self) -> 'tuple[MetaNode, ...]':
+        """Returns the chain of nodes from this node up to the root.
+
+        The chain is memoized on every node it passes through, and each
+        cache entry is built as (node,) + parent chain, so siblings
+        share their common suffix instead of re-walking it. Adding
+        descendants never changes an existing node's own path; attach
+        reparents nodes through _link_parent, which drops stale caches.
+
+        Returns:
+            tuple[MetaNode, ...]: This node followed by its ancestors,
+            most recent first."""
+
+        if self._ancestors is None:
+            # Walk up to the nearest cached ancestor, then fill the
+            # caches back down from its chain.
+            chain = []
+            node = self
+            while node is not None and node._ancestors is None:
+                chain.append(node)
+                node = node.parent
+
+            suffix = () if node is None else node._ancestors
+            for node in reversed(chain):
+                suffix = (node,) + suffix
+                node._ancestors = suffix
+
+        return self._ancestors
+
+    def ancestors(self) -> 'Iterator[MetaNode]':
+        """Yields this node followed by its ancestors, lazily.
+
+        Unlike path_to_root this materializes nothing, so consumers
+        that only need a prefix of the chain (the first match, the
+        nearest cached ancestor, ...) stop paying as soon as they
+        break out of the loop.
+
+        Returns:
+            Iterator[MetaNode]: This node, then each parent up to and
+            including the root."""
+
+        node = self
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def kth_ancestor(self, k: int) -> 'Optional[MetaNode]':
+        """Returns the ancestor `k` generations up from this node.
+
+        Uses the jump pointers to hop in powers of two, so the walk
+        takes O(log k) steps instead of k parent dereferences.
+
+        Args:
+            k (int): How many generations to go up. 0 returns the node
+                itself.
+
+        Returns:
+            Optional[MetaNode]: The requested ancestor, or None if the
+            chain is shorter than `k`."""
+
+        node = self
+        while k > 0:
+            jumps = node._jumps
+            if not jumps:
+                return None
+            i = min(k.bit_length() - 1, len(jumps) - 1)
+            node = jumps[i]
+            k -= 1 << i
+
+        return node
+
+    @property
+    def all_descendants(self) -> 'tuple[MetaNode, ...]':
+        """Every node below this one, as a memoized flat tuple.
+
+        The first access pays one iterative DFS; repeated tree stats on
+        an unchanged subtree are then free. Mutations below this node
+        drop the cache through _clear_subtree_caches."""
+
+        if self._subtree is None:
+            nodes = []
+            stack = list(self.descendants or ())
+            append = nodes.append
+            pop = stack.pop
+            extend = stack.extend
+            while stack:
+                node = pop()
+                append(node)
+                extend(node.descendants or ())
+            self._subtree = tuple(nodes)
+
+        return self._subtree
+
+    @property
+    def tips(self) -> 'tuple[MetaNode, ...]':
+        """The leaves of the subtree below this node, memoized.
+
+        A node with no descendants is its own tip."""
+
+        if self._tips is None:
+            if not self.descendants:
+                self._tips = (self,)
+            else:
+                self._tips = tuple(
+                    node for node in self.all_descendants
+                    if not node.descendants
+                )
+
+        return self._tips
+
+    def _clear_subtree_caches(self):
+        """Drops the memoized subtree views on this node and on every
+        ancestor — an O(depth) walk, far cheaper than the O(N)
+        recomputes the caches save."""
+
+        node = self
+        while node is not None:
+            node._subtree = None
+            node._tips = None
+            node = node.parent
+
+    def ancestor_at_depth(self, generation: int) -> 'Optional[MetaNode]':
+        """Returns this node's ancestor at the given generation.
+
+        Args:
+            generation (int): The generation of the wanted ancestor.
+                Must not exceed this node's own generation.
+
+        Returns:
+            Optional[MetaNode]: The ancestor sitting at `generation` on
+            this node's chain, or None if the generation is deeper than
+            the node or the chain is shorter than expected."""
+
+        if generation > self.generation:
+            return None
+
+        return self.kth_ancestor(self.generation - generation)
+
+    def is_ancestor(self, other: 'MetaNode') -> bool:
+        """Returns whether this node is an ancestor of the other node.
+
+        Args:
+            other (MetaNode): The candidate descendant.
+
+        Returns:
+            bool: True if `other` descends from this node (a node is
+            not its own ancestor)."""
+
+        if self.generation >= other.generation:
+            return False
+
+        return other.kth_ancestor(other.generation - self.generation) is self
+
+    def common_ancestor(self, other: 'MetaNode') -> 'Optional[MetaNode]':
+        """Returns the lowest common ancestor with the other node.
+
+        Both nodes are first lifted to the same generation, then walked
+        up together with the jump pointers, giving O(log depth) time
+        rather than materializing both parent chains.
+
+        Args:
+            other (MetaNode): The node to compare lineages with.
+
+        Returns:
+            Optional[MetaNode]: The deepest node present in both parent
+            chains, or None if the nodes share no ancestor."""
+
+        a, b = self, other
+        if a.generation > b.generation:
+            a = a.kth_ancestor(a.generation - b.generation)
+        elif b.generation > a.generation:
+            b = b.kth_ancestor(b.generation - a.generation)
+
+        if a is None or b is None:
+            return None
+
+        if a is b:
+            return a
+
+        # Same generation means the jump tables have the same length.
+        for i in range(len(a._jumps) - 1, -1, -1):
+            if a._jumps[i] is not b._jumps[i]:
+                a, b = a._jumps[i], b._jumps[i]
+
+        parent_a = a._jumps[0] if a._jumps else None
+        parent_b = b._jumps[0] if b._jumps else None
+
+        return parent_a if parent_a is parent_b else None
 
     def add_descendant(
         self,
-        player: Player,
+        id: str = None,
         interaction: Optional['Interaction'] = None,
         timestep: Optional[int] = 1,
-        branch: Optional[str] = None
-    ) -> 'Player':
+        branch: Optional[str] = None,
+        player: Optional[Player] = None
+    ) -> 'MetaNode':
 
         """Adds a decendant to this node
 
@@ -105,28 +363,55 @@ class MetaNode:
 
         """
 
-        branch = self.branch if branch is None else branch
+        if branch is None:
+            branch = self.branch
 
-        # Create child node
+        # Create child node. Arguments are passed positionally: keyword
+        # calls allocate a dict and match strings, which is measurable
+        # on the per-commit hot path.
         descendant = MetaNode(
-            player=player,
-            parent=self,
-            interaction=interaction,
-            generation=self.generation + 1,
-            timestep=timestep,
-            branch=branch
+            player, self, None, interaction,
+            self.generation + 1, timestep, branch, id
         )
 
-        self.descendants.append(descendant)
+        descendant._link_parent(self)
+
+        if self.descendants is None:
+            self.descendants = [descendant]
+        else:
+            self.descendants.append(descendant)
+        self._clear_subtree_caches()
 
         return descendant
 
+    def _link_parent(self, parent: 'MetaNode'):
+        """Points this node at a parent and rebuilds the caches derived
+        from the parent chain (memoized path and jump pointers)."""
+
+        self.parent = parent
+        self._ancestors = None
+
+        jumps = self._jumps
+        jumps.clear()
+        jumps.append(parent)
+        ancestor, k = parent, 0
+        while len(ancestor._jumps) > k:
+            ancestor = ancestor._jumps[k]
+            jumps.append(ancestor)
+            k += 1
+
 
 class Population:
     """A data structure to manipulate evolving populations of players.
     The structure is meant to be similar to that of a git repository, where
     every commit corresponds to an agent."""
 
+    # The default serializer is stateless, so one shared instance
+    # serves every population instead of a fresh allocation per
+    # constructor call (detach/attach create many).
+    _default_post_commit_hooks = ()
+    _default_serializer = PlayerKeyValueSerializer()
+
     def __init__(
         self,
         root: Optional[MetaNode] = None,
@@ -149,23 +434,77 @@ class Population:
         root = root if root else MetaNode(
             player=None, parent=None, branch=root_branch
         )
+        if root.id is None:
+            # The root carries no player, so it is registered under the
+            # population's root name.
+            root.id = root_name
+        # The population starts on root_branch, so the root must carry
+        # it: a prebuilt root (detach) may arrive tagged with a branch
+        # that is not registered here, and _branch is seeded from the
+        # root's branch below.
+        root.branch = root_branch
         self._root = root
 
+        # commit() assigns missing ids inline, so the repository runs
+        # hook-free on this, the common, configuration; PlayerAutoIdHook
+        # remains available for custom Repository assemblies.
         self.repo = Repository[Player](
             stage=stage,
-            pre_commit_hooks=[PlayerAutoIdHook()],
-            serializer=PlayerKeyValueSerializer()
+            post_commit_hooks=self._default_post_commit_hooks,
+            serializer=self._default_serializer
         )
 
         self.repo.commit(root_name, self._root)
         self.repo.branch(root_branch, self._root)
 
-        # An array of every node indexed by generation (1st gen has index 0)
-        # self._generations: List[List[Player]] = [[]]
+        # Nodes indexed by generation. A defaultdict keeps _add_gen to a
+        # single append, with no bounds check or conditional list creation.
+        self._generations: 'defaultdict[int, List[MetaNode]]' = \
+            defaultdict(list)
+        self._generations[self._root.generation].append(self._root)
+
+        # SoA mirror of per-commit metadata: dense int32 columns that
+        # bulk analytics can scan with single vectorized ops instead of
+        # chasing node objects. _commit_nodes maps the dense index back
+        # to the nodes.
+        self._commit_count: int = 0
+        self._commit_capacity: int = 8
+        self._commit_gens = np.empty(self._commit_capacity, dtype=np.int32)
+        self._commit_timesteps = np.empty(
+            self._commit_capacity, dtype=np.int32
+        )
+        self._commit_branches = np.empty(
+            self._commit_capacity, dtype=np.int32
+        )
+        self._branch_ids: 'dict[str, int]' = {}
+        self._commit_nodes: 'List[MetaNode]' = []
+        self._record_commit(self._root)
 
         self._player: Player = self._root
         self._branch: str = self._root.branch
 
+        # Counter used to give each detached population its own stage
+        # subdirectory.
+        self._detach_count: int = 0
+
+        # Next rename suffix per branch base name, kept across attach
+        # calls so repeated attaches do not re-probe burnt suffixes.
+        self._branch_collision_counter: 'dict[str, int]' = {}
+
+        # Memoized ancestor queries; repeated detach/attach workflows
+        # keep asking about the same pairs. Rebuilt on mutation.
+        self._reset_ancestor_cache()
+
+        # Compact read-only layout built by freeze(); dropped again on
+        # the next mutation.
+        self._frozen: bool = False
+        self._node_arr: 'List[MetaNode]' = None
+        self._node_index: 'dict[str, int]' = None
+        self._parent_idx: array = None
+        self._children_flat: array = None
+        self._children_offsets: array = None
+        self._subtree_end: array = None
+
     def commit(
         self,
         id: str = None,
@@ -195,26 +534,132 @@ class Population:
         Returns:
             str: The id_str of the new commit.
         """
-        if self.repo.exists(id):
+        if id is not None and self.repo.exists(id):
             raise ValueError(POPULATION_COMMIT_EXIST.format(id))
         # Create the child node
         next_player = self._player.add_descendant(
-            id=id,
-            interaction=interaction,
-            timestep=timestep,
-            branch=self._branch
+            id, interaction, timestep, self._branch
         )
 
+        if next_player.id is None:
+            next_player.id = _auto_id(next_player)
+
         if self.repo.exists(next_player.id):
             raise ValueError(POPULATION_COMMIT_EXIST.format(id))
 
         self.repo.commit(next_player.id, next_player)
         self.repo.branch(self._branch, next_player)
 
+        self._add_gen(next_player)
+        self._record_commit(next_player)
         self._player = next_player
 
+        self._invalidate_topology()
+
         return next_player.id
 
+    def commit_many(
+        self,
+        ids: 'Iterable[Optional[str]]',
+        interactions: 'Iterable[Interaction | None]' = None,
+        timesteps: 'Iterable[int]' = None,
+    ) -> 'List[str]':
+        """Creates a chain of commits in the current branch at once.
+
+        Equivalent to calling commit() once per entry, but the
+        user-supplied ids — including duplicates within the batch —
+        are checked up front before anything is written, the branch
+        tip is updated once at the end instead of per commit, and the
+        memoized topology is dropped a single time. Tight generation
+        loops should prefer this over repeated commit() calls.
+
+        Args:
+            ids (Iterable[Optional[str]]): One id per commit. None
+                entries get an auto-generated id.
+
+            interactions (Iterable[Interaction | None]): One
+                interaction per commit. Defaults to None for every
+                commit.
+
+            timesteps (Iterable[int]): One timestep per commit.
+                Defaults to 1 for every commit.
+
+        Raises:
+            ValueError: If one of the specified ids already exists or
+                appears twice in the batch, or if the columns do not
+                all have one entry per commit.
+
+        Returns:
+            List[str]: The ids of the new commits, in order."""
+
+        ids = list(ids)
+        # Materialize and length-check the columns before anything is
+        # written; zip alone would silently truncate the batch to the
+        # shortest column.
+        if interactions is None:
+            interactions = [None] * len(ids)
+        else:
+            interactions = list(interactions)
+        if timesteps is None:
+            timesteps = [1] * len(ids)
+        else:
+            timesteps = list(timesteps)
+        if len(interactions) != len(ids) or len(timesteps) != len(ids):
+            raise ValueError(POPULATION_BATCH_LENGTH_MISMATCH.format(
+                len(ids), len(interactions), len(timesteps)
+            ))
+
+        exists = self.repo.exists
+        seen = set()
+        for id in ids:
+            if id is None:
+                continue
+            if id in seen or exists(id):
+                raise ValueError(POPULATION_COMMIT_EXIST.format(id))
+            seen.add(id)
+
+        # Hoist the bound methods; this loop is the hot path the
+        # batch API exists for.
+        repo_commit = self.repo.commit
+        add_gen = self._add_gen
+        record = self._record_commit
+        branch = self._branch
+        player = self._player
+
+        new_ids = []
+        try:
+            for id, interaction, timestep in zip(
+                ids, interactions, timesteps
+            ):
+                node = player.add_descendant(
+                    id, interaction, timestep, branch
+                )
+                if node.id is None:
+                    node.id = _auto_id(node)
+                # Guards against auto-id collisions; user ids were
+                # vetted up front. Drop the graft so a failed batch
+                # leaves no orphan in the tree.
+                if exists(node.id):
+                    player.descendants.remove(node)
+                    player._clear_subtree_caches()
+                    raise ValueError(
+                        POPULATION_COMMIT_EXIST.format(node.id)
+                    )
+                repo_commit(node.id, node)
+                add_gen(node)
+                record(node)
+                new_ids.append(node.id)
+                player = node
+        finally:
+            # On failure the committed prefix stays, so the branch tip
+            # and memoized topology must still catch up with it.
+            if new_ids:
+                self.repo.branch(branch, player)
+                self._player = player
+                self._invalidate_topology()
+
+        return new_ids
+
     def branch(self, name: str = None) -> str:
         """Create a new branch diverging from the current branch.
 
@@ -233,6 +678,8 @@ class Population:
         if name is None:
             return self._branch
 
+        name = sys.intern(name)
+
         if self.repo.exists(name):
             raise ValueError(POPUPLATION_BRANCH_EXISTS.format(name))
 
@@ -249,16 +696,27 @@ class Population:
         Raises:
             ValueError: If there is no branch with the specified name"""
 
-        if not self.repo.exists(name):
-            raise ValueError(POPULATION_PLAYER_NOT_EXIST.format(name))
+        branches = self.repo._branches
 
-        if name in self.repo._branches:
+        # Reselecting the current branch while already at its tip is a
+        # common defensive no-op in outer loops; answer it with one
+        # tip probe instead of reloading the head. A plain name match
+        # is not enough: after checking out an old commit the branch
+        # name sticks while the head does not point at the tip. The
+        # membership check keeps the fast path from ever raising out
+        # of the storage layer.
+        if name == self._branch and name in branches \
+                and branches.read(name) == self._player.id:
+            return name
+
+        if name in branches:
             self._branch = name
-            self._player: Player = self.repo.commit(
-                self.repo.branch(name)
-            )
+            self._player: Player = self.repo.commit(branches.read(name))
         else:
-            self._player: Player = self.repo.commit(name, None)
+            if not self.repo.exists(name):
+                raise ValueError(POPULATION_PLAYER_NOT_EXIST.format(name))
+
+            self._player: Player = self.repo.commit(name)
             self._branch = self._player.branch
 
         return self._branch
@@ -279,18 +737,38 @@ class Population:
         hence this should be thread-safe. This may then be reattached once
         operations have been performed.
 
+        The detached root is a lightweight copy-on-write handle: it
+        shares the current node's player and interaction but owns its
+        descendants list, and its generation is rebased to 0 so that
+        attach can shift the whole subtree by the attach point's
+        generation in its single splice pass. The detached repository
+        stages under a subdirectory of the current stage, so deleting
+        this population also cleans up its detached offspring.
+
+        The detached population starts on the default branch of a
+        fresh Population rather than inheriting the origin branch
+        name, so branch names from the origin stay available; attach
+        renames any branch that does collide when splicing back.
+
         Returns:
             Population: A new population with the current player as
             root.
         """
-        # TODO: detach persistence
-        detached_pop = Population(
-            root=self._player,
-            pre_commit_hooks=self._pre_commit_hooks,
-            post_commit_hooks=self._post_commit_hooks,
-            attach_hooks=self._attach_hooks,
+        self._detach_count += 1
+
+        root = MetaNode(
+            self._player.player, None, None, self._player.interaction,
+            0, self._player.timestep
+        )
+        root.id = self._player.id
+
+        return Population(
+            root=root,
+            root_name=self._player.id,
+            stage=os.path.join(
+                self.stage, 'detach{0}'.format(self._detach_count)
+            )
         )
-        return detached_pop
 
     def delete(self):
         self.repo.delete()
@@ -343,59 +821,313 @@ class Population:
         # not loadable anymore since the name changed
 
         # TODO: attach persistence
-        if population._root.id not in self.repo:
+        if not self.repo.exists(population._root.id):
             raise ValueError(POPULATION_PLAYER_NOT_EXIST.format(
                 population._root.id))
 
         # Pick the right place to reattach
-        node: Player = self.repo[population._root.id]
+        node: MetaNode = self.repo.commit(population._root.id)
+
+        # Rename branches in attached pop to avoid conflicts
+        _, branch_renaming = self._rename_conflicting_branches(population)
+
+        # Splice the subtrees onto the attach point in one C-level
+        # extend; reparenting happens in the BFS below. The spliced
+        # nodes' own subtree caches stay valid; only the chain above
+        # the attach point sees new nodes, so one clear from there
+        # suffices.
+        spliced = population._root.descendants or ()
+        if node.descendants is None:
+            node.descendants = list(spliced)
+        else:
+            node.descendants.extend(spliced)
+        node._clear_subtree_caches()
 
-        # Transfer all the nodes from the other pop to the right place
-        for player in population._root.descendants:
-            node.descendants.append(player)
-            player.parent = node
+        # A single breadth-first pass over the spliced subtrees only —
+        # the attach point may already carry descendants from earlier
+        # attaches. Parents are processed before their children, so
+        # renamed branches, shifted generations and rebuilt ancestor
+        # caches are final by the time each node is committed.
+        gen_buckets: 'defaultdict[int, List[MetaNode]]' = defaultdict(list)
 
-        nodes_to_add = {}
+        queue = deque(spliced)
+        while queue:
+            player = queue.popleft()
 
-        # Rename branches in attached pop to avoid conflicts
-        branches_to_add, branch_renaming = self._rename_conflicting_branches(
-            population
+            if player.parent is node or player.parent is population._root:
+                player._link_parent(node)
+            else:
+                player._link_parent(player.parent)
+
+            player.branch = branch_renaming[player.branch]
+            player.generation += node.generation
+
+            if self.repo.exists(player.id):
+                raise ValueError(POPULATION_COMMIT_EXIST.format(player.id))
+
+            self.repo.commit(player.id, player)
+            gen_buckets[player.generation].append(player)
+            self._record_commit(player)
+            queue.extend(player.descendants or ())
+
+        # One list.extend per generation instead of one _add_gen call
+        # per node.
+        generations = self._generations
+        for gen, players in gen_buckets.items():
+            generations[gen].extend(players)
+
+        # Point the renamed branches at their tips
+        for branch, renamed in branch_renaming.items():
+            tip = population.repo.branch(branch)
+            if tip == population._root.id:
+                self.repo.branch(renamed, node)
+            else:
+                self.repo.branch(renamed, self.repo.commit(tip))
+
+        self._invalidate_topology()
+
+    def _add_gen(self, player: MetaNode):
+        """Records the node in the generation index."""
+        self._generations[player.generation].append(player)
+
+    def _record_commit(self, node: MetaNode):
+        """Appends the node to the dense per-commit columns, doubling
+        capacity when full."""
+
+        i = self._commit_count
+        if i == self._commit_capacity:
+            self._commit_capacity *= 2
+            self._commit_gens = np.resize(
+                self._commit_gens, self._commit_capacity
+            )
+            self._commit_timesteps = np.resize(
+                self._commit_timesteps, self._commit_capacity
+            )
+            self._commit_branches = np.resize(
+                self._commit_branches, self._commit_capacity
+            )
+
+        node._idx = i
+        self._commit_gens[i] = node.generation
+        self._commit_timesteps[i] = node.timestep
+        self._commit_branches[i] = self._branch_ids.setdefault(
+            node.branch, len(self._branch_ids)
         )
+        self._commit_nodes.append(node)
+        self._commit_count = i + 1
 
-        for name, player in population.repo.items():
-            # Ignore root node
-            if name == population._root.id:
-                continue
+    def generations_array(self) -> np.ndarray:
+        """Returns the generation of every commit as a dense array.
 
-            # Add the renamed branches to the main pop
-            if name in population._branches:
-                nodes_to_add[branch_renaming[name]] = player
-                continue
+        Returns:
+            np.ndarray: int32 view, one entry per commit in commit
+            order. A view into the population's own storage — copy
+            before mutating."""
 
-            # Apply branch renaming
-            player.branch = branch_renaming[player.branch]
+        return self._commit_gens[:self._commit_count]
 
-            player.generation += node.generation
+    def filter(
+        self, generation: Optional[int] = None,
+        branch: Optional[str] = None
+    ) -> 'List[MetaNode]':
+        """Returns the commits matching the given criteria.
+
+        Runs as vectorized mask operations over the dense per-commit
+        columns, one C-level scan per criterion, instead of a Python
+        walk over the node objects.
+
+        Args:
+            generation (int): Only keep commits of this generation, if
+                given. Defaults to None.
+
+            branch (str): Only keep commits on this branch, if given.
+                Defaults to None.
 
-            if player.name is None:
-                # TODO: This seems incomplete
-                node = player
-                path = ''
-                while node is not None:
-                    path += str(node)
-                    node = node.parent
+        Returns:
+            List[MetaNode]: The matching commits, in commit order."""
+
+        n = self._commit_count
+        mask = np.ones(n, dtype=bool)
+
+        if generation is not None:
+            mask &= self._commit_gens[:n] == generation
+
+        if branch is not None:
+            branch_id = self._branch_ids.get(branch, -1)
+            mask &= self._commit_branches[:n] == branch_id
+
+        nodes = self._commit_nodes
+        return [nodes[i] for i in np.nonzero(mask)[0]]
+
+    def timesteps_array(self) -> np.ndarray:
+        """Returns the timestep of every commit as a dense array.
+
+        Returns:
+            np.ndarray: int32 view, one entry per commit in commit
+            order. A view into the population's own storage — copy
+            before mutating."""
+
+        return self._commit_timesteps[:self._commit_count]
+
+    def freeze(self):
+        """Compacts the tree into contiguous arrays for read workloads.
+
+        Nodes are laid out in preorder in a single list with integer
+        parent pointers and a CSR-style (offsets + flat indices) child
+        table, so bulk traversals follow ints through dense arrays
+        instead of chasing per-node Python lists across the heap. The
+        layout is dropped automatically by the next commit or attach.
+        """
+
+        nodes: 'List[MetaNode]' = []
+        index: 'dict[str, int]' = {}
+        stack = [self._root]
+        append = nodes.append
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            index[node.id] = len(nodes)
+            append(node)
+            extend(reversed(node.descendants or ()))
+
+        parent_idx = array('i', (
+            index[node.parent.id] if node.parent is not None else -1
+            for node in nodes
+        ))
+
+        children_flat = array('i')
+        children_offsets = array('i', [0])
+        for node in nodes:
+            children_flat.extend(
+                index[descendant.id]
+                for descendant in node.descendants or ()
+            )
+            children_offsets.append(len(children_flat))
+
+        # Preorder subtree intervals: node i's subtree is exactly
+        # nodes[i:end[i]]. This is the flat-array equivalent of a
+        # balanced-parentheses encoding — ancestor tests, descendant
+        # counts and subtree enumeration all become range arithmetic.
+        sizes = [1] * len(nodes)
+        for i in range(len(nodes) - 1, 0, -1):
+            sizes[parent_idx[i]] += sizes[i]
+        subtree_end = array('i', (i + s for i, s in enumerate(sizes)))
+
+        self._node_arr = nodes
+        self._node_index = index
+        self._parent_idx = parent_idx
+        self._children_flat = children_flat
+        self._children_offsets = children_offsets
+        self._subtree_end = subtree_end
+        self._frozen = True
+
+    def _invalidate_topology(self):
+        """Drops memoized topology views after a structural change."""
+        self._reset_ancestor_cache()
+        if self._frozen:
+            self._thaw()
+
+    def _thaw(self):
+        """Drops the frozen layout after a mutation."""
+        self._frozen = False
+        self._node_arr = None
+        self._node_index = None
+        self._parent_idx = None
+        self._children_flat = None
+        self._children_offsets = None
+        self._subtree_end = None
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """Returns whether one commit is an ancestor of the other.
+
+        Args:
+            ancestor (str): The name of the candidate ancestor commit.
+
+            descendant (str): The name of the candidate descendant
+                commit.
+
+        Returns:
+            bool: True if `descendant` descends from `ancestor`. On a
+            frozen population this is two array reads; otherwise it
+            falls back to the nodes' jump pointers."""
+
+        if self._frozen:
+            index = self._node_index
+            a, b = index[ancestor], index[descendant]
+            return a < b < self._subtree_end[a]
+
+        return self._is_ancestor_cached(ancestor, descendant)
 
-            if name in self.repo:
-                raise ValueError(POPULATION_COMMIT_EXIST.format(name))
+    def _is_ancestor_uncached(self, ancestor: str, descendant: str) -> bool:
+        return self.repo.commit(ancestor).is_ancestor(
+            self.repo.commit(descendant)
+        )
+
+    def _reset_ancestor_cache(self):
+        """Wraps the ancestor query in a fresh lru_cache; reassigning
+        the wrapper is how the memo is invalidated after a structural
+        change."""
+        self._is_ancestor_cached = functools.lru_cache(maxsize=8192)(
+            self._is_ancestor_uncached
+        )
 
-            # Add player to the index
-            self._nodes[player.name] = player
+    def ancestors_of(
+        self, names: 'Iterable[str]'
+    ) -> 'dict[str, List[str]]':
+        """Returns the ancestor chains for a batch of commits at once.
 
-            self._add_gen(player)
+        The chains ride the nodes' memoized paths, so each shared
+        ancestor is walked at most once across the whole batch no
+        matter how many requested leaves sit below it — per-leaf
+        lineage loops re-walk the common prefix every time.
 
-        # Add branches to the index
-        self._nodes.update(nodes_to_add)
-        self._branches = self._branches.union(branches_to_add)
+        Args:
+            names (Iterable[str]): The names of the commits to query.
+
+        Returns:
+            dict[str, List[str]]: For each requested name, the names of
+            the commit and its ancestors, most recent first."""
+
+        read = self.repo._objects.read
+        return {
+            name: [node.id for node in read(name).path_to_root()]
+            for name in names
+        }
+
+    def descendant_count(self, name: str = None) -> int:
+        """Returns how many commits descend from the given one.
+
+        Args:
+            name (str): The name of the commit. If None, counts the
+                descendants of the current head. Defaults to None.
+
+        Returns:
+            int: The size of the subtree below the commit, excluding
+            the commit itself."""
+
+        node = self._player if name is None else self.repo.commit(name)
+
+        if self._frozen:
+            i = self._node_index[node.id]
+            return self._subtree_end[i] - i - 1
+
+        count = -1  # the starting node does not count itself
+        stack = [node]
+        while stack:
+            count += 1
+            stack.extend(stack.pop().descendants or ())
+
+        return count
+
+    def _frozen_descendants(self, node: MetaNode) -> 'Iterator[MetaNode]':
+        """Yields the node and its subtree out of the frozen arrays.
+
+        Subtrees are contiguous preorder intervals, so this is a plain
+        slice scan rather than a stack walk."""
+
+        i = self._node_index[node.id]
+        return iter(self._node_arr[i:self._subtree_end[i]])
 
     @property
     def stage(self):
@@ -408,13 +1140,23 @@ class Population:
         branches_to_add = set()
         branch_renaming = {}
 
-        for branch in population._branches:
+        # Snapshot the taken names once; probing the repository index per
+        # candidate would rehash the same strings for every branch.
+        taken = set(self.repo._index)
+        suffix = self._branch_collision_counter
+
+        for branch in population.branches():
             new_branch = branch
-            i = 1
-            while self._index.exists(new_branch):
+            if new_branch in taken:
+                i = suffix.get(branch, 1)
                 new_branch = branch + str(i)
-                i += 1
+                while new_branch in taken:
+                    i += 1
+                    new_branch = branch + str(i)
+                suffix[branch] = i + 1
 
+            new_branch = sys.intern(new_branch)
+            taken.add(new_branch)
             branches_to_add.add(new_branch)
             branch_renaming[branch] = new_branch
 
@@ -122,7 +122,6 @@ class MultifileStore(Store[File]):
         self._path = path
         self._cache = Memory[MemoryObject]()
         self._filesystem = filesystem
-        self._filesystem.makedirs(path, exist_ok=True)
 
     def write(self, key: str, value: File):
         assert key not in self._cache
@@ -136,7 +135,8 @@ class MultifileStore(Store[File]):
         for key in self._cache:
             self._cache[key].delete()
         self._cache.delete()
-        self._filesystem.delete(self._path, recursive=True)
+        if self._filesystem.exists(self._path):
+            self._filesystem.delete(self._path, recursive=True)
 
     def remove(self, key: str):
         assert key in self._cache
@@ -0,0 +1,29 @@
+from abc import abstractmethod
+
+from .repo import Hook, Metadata, Repository
+
+
+class PreCommitHook(Hook):
+    """
+       Hook invoked before a commit is written to the repository.
+    """
+
+    def __call__(self, repo: 'Repository', metadata: Metadata, **kwds):
+        return self._pre(repo, metadata, **kwds)
+
+    @abstractmethod
+    def _pre(self, repo: 'Repository', metadata: Metadata, **kwds):
+        raise NotImplementedError()
+
+
+class PostCommitHook(Hook):
+    """
+       Hook invoked after a commit has been written to the repository.
+    """
+
+    def __call__(self, repo: 'Repository', metadata: Metadata, **kwds):
+        return self._post(repo, metadata, **kwds)
+
+    @abstractmethod
+    def _post(self, repo: 'Repository', metadata: Metadata, **kwds):
+        raise NotImplementedError()
@@ -1,3 +1,4 @@
+import os
 from typing import Dict, Iterable, Optional
 import fsspec
 import yaml
@@ -14,10 +15,22 @@ class KeyValueFile(File[MemoryObject]):
         serializer: Optional[Serializer[MemoryObject, Dict]] = None,
     ) -> None:
         super().__init__(path, filesystem, serializer)
-        self._file = filesystem.open(self._path, mode="a+")
+        # The backing file (and its directory) is only created on the
+        # first access that actually touches disk; tables that stay
+        # in memory cost no syscalls.
+        self._file_handle = None
         self._cache = Memory[MemoryObject]()
         self._serializer = serializer
 
+    @property
+    def _file(self):
+        if self._file_handle is None:
+            self._filesystem.makedirs(
+                os.path.dirname(self._path), exist_ok=True
+            )
+            self._file_handle = self._filesystem.open(self._path, mode="a+")
+        return self._file_handle
+
     def write(self, key: str, value: MemoryObject):
         self._cache.write(key, value)
 
@@ -30,7 +43,7 @@ class KeyValueFile(File[MemoryObject]):
 
     def read(self, key: str) -> MemoryObject:
         if key not in self._cache:
-            self._read_all(self._file)
+            self._read_all()
         if key not in self._cache:
             raise ValueError()
 
@@ -49,8 +62,10 @@ class KeyValueFile(File[MemoryObject]):
 
     def delete(self):
         self._cache.delete()
-        self._file.close()
-        self._filesystem.rm_file(self._path)
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+            self._filesystem.rm_file(self._path)
 
     def iter(self) -> Iterable[MemoryObject]:
         return self._cache.iter()
@@ -68,9 +68,17 @@ class Repository(Generic[Metadata]):
         )
         self._metadata.write(self._struct.objects, self._objects)
 
-        self._pre_hooks = pre_commit_hooks if pre_commit_hooks else []
+        # Hooks are frozen into tuples once; commit() iterates them on
+        # every call and an empty tuple makes the no-hook case free.
+        # Hooks that expose a _pre/_post method are stored as that bound
+        # method directly, skipping their __call__ wrapper frame.
+        self._pre_hooks = tuple(
+            getattr(hook, '_pre', hook) for hook in pre_commit_hooks
+        ) if pre_commit_hooks else ()
         # Post-Commit Hooks
-        self._post_hooks = post_commit_hooks if post_commit_hooks else []
+        self._post_hooks = tuple(
+            getattr(hook, '_post', hook) for hook in post_commit_hooks
+        ) if post_commit_hooks else ()
 
     def commit(
         self, name: str, metadata: Optional[Metadata] = None,
@@ -102,9 +110,12 @@ class Repository(Generic[Metadata]):
             assert name in self._branches
             return self._branches[name]
 
-        # assert name not in self._branches
+        # The index only needs the branch name once, for existence
+        # checks; tip updates happen on every commit and touch just the
+        # branch table.
+        if name not in self._branches:
+            self._index.write(name, metadata.id)
         self._branches.write(name, metadata.id)
-        self._index.write(name, metadata.id)
         return name
 
     def exists(self, name: str):
@@ -115,7 +126,8 @@ class Repository(Generic[Metadata]):
 
     def delete(self):
         self._metadata.delete()
-        self._fs.delete(self._stage, recursive=True)
+        if self._fs.exists(self._stage):
+            self._fs.delete(self._stage, recursive=True)
 
     @property
     def structure(self):
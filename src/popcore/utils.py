@@ -1,6 +1,4 @@
 from .population import Population
-from .iter import flatten
-
 
 
 def draw(population: Population):
@@ -13,15 +11,23 @@ def draw(population: Population):
     from networkx.drawing.nx_pydot import graphviz_layout   # type: ignore
 
     graph = nx.Graph()
-    graph.add_nodes_from(population._nodes.keys())
 
-    for node in flatten(population):
-        graph.add_edge(node.id, node.parent.id)
+    # Bind the graph methods once instead of looking them up per node.
+    add_node = graph.add_node
+    add_edge = graph.add_edge
+
+    stack = [population._root]
+    while stack:
+        node = stack.pop()
+        add_node(node.id)
+        if node.parent is not None:
+            add_edge(node.id, node.parent.id)
+        stack.extend(node.descendants or ())
 
     pos = graphviz_layout(graph, prog="dot")
     nx.draw_networkx(
         graph,
         pos,
-        labels={x.name: x.name for x in population._nodes.values()}
+        labels={name: name for name in graph.nodes}
     )
     plt.show()
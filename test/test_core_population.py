@@ -0,0 +1,19 @@
+import unittest
+
+from popcore import Player, Population
+
+
+class TestCorePopulation(unittest.TestCase):
+
+    def test_contains_aggregated_player(self):
+        player = Player(id="a")
+        population = Population("pop", [player])
+
+        self.assertIn(player, population)
+        self.assertIn("a", population)
+
+    def test_contains_is_false_for_absent_player(self):
+        population = Population("pop", [Player(id="a")])
+
+        self.assertNotIn(Player(id="zzz"), population)
+        self.assertNotIn("zzz", population)
@@ -0,0 +1,56 @@
+import unittest
+
+from popcore import History, Interaction
+
+
+class TestHistory(unittest.TestCase):
+
+    def test_to_payoff_matrix_accumulates_outcomes(self):
+        history = History([
+            Interaction(["a", "b"], [1, 0]),
+            Interaction(["a", "b"], [1, 0]),
+            Interaction(["b", "a"], [1, 0]),
+        ])
+
+        payoffs = history.to_payoff_matrix()
+
+        a, b = history._population["a"], history._population["b"]
+        self.assertEqual(payoffs[a, b], 2.0)
+        self.assertEqual(payoffs[b, a], 1.0)
+
+    def test_to_payoff_matrix_decomposes_multiplayer(self):
+        history = History([
+            Interaction(["a", "b", "c"], [1, 2, 3]),
+        ])
+
+        payoffs = history.to_payoff_matrix()
+
+        a, c = history._population["a"], history._population["c"]
+        self.assertEqual(payoffs[a, c], 1.0)
+        self.assertEqual(payoffs[c, a], 3.0)
+
+    def test_to_payoffs_averages_outcomes(self):
+        history = History([
+            Interaction(["a", "b"], [2, 0]),
+            Interaction(["a", "b"], [1, 0]),
+        ])
+
+        payoffs = history.to_payoffs()
+
+        a, b = history._population["a"], history._population["b"]
+        self.assertEqual(payoffs[a, b], 1.5)
+        self.assertEqual(payoffs[b, a], 0.0)
+
+    def test_to_winrates_counts_positive_outcomes(self):
+        history = History([
+            Interaction(["a", "b"], [1, 0]),
+            Interaction(["a", "b"], [1, 0]),
+            Interaction(["a", "b"], [0, 1]),
+            Interaction(["a", "b"], [0, 1]),
+        ])
+
+        winrates = history.to_winrates()
+
+        a, b = history._population["a"], history._population["b"]
+        self.assertEqual(winrates[a, b], 0.5)
+        self.assertEqual(winrates[b, a], 0.5)
@@ -32,3 +32,38 @@ class TestInteraction(unittest.TestCase):
             pairwise,
             interaction.to_pairwise()
         )
+
+    def test_from_batches_matches_single_construction(self):
+        batch = Interaction.from_batches(
+            players_batch=[["a", "b"], ["c", "d"]],
+            outcomes_batch=[[1, 0], [0, 1]]
+        )
+
+        self.assertListEqual(
+            [
+                Interaction(["a", "b"], [1, 0]),
+                Interaction(["c", "d"], [0, 1])
+            ],
+            batch
+        )
+
+    def test_from_batches_accepts_generators(self):
+        batch = Interaction.from_batches(
+            players_batch=(players for players in [["a", "b"], ["c", "d"]]),
+            outcomes_batch=(outcomes for outcomes in [[1, 0], [0, 1]])
+        )
+
+        self.assertListEqual(
+            [
+                Interaction(["a", "b"], [1, 0]),
+                Interaction(["c", "d"], [0, 1])
+            ],
+            batch
+        )
+
+    def test_from_batches_should_raise_on_shape_mismatch(self):
+        self.assertRaises(
+            ValueError,
+            Interaction.from_batches,
+            [["a", "b"]], [[1, 0], [0, 1]]
+        )
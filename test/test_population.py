@@ -104,6 +104,54 @@ class TestPopulation(unittest.TestCase):
         with Population() as pop:
             self.assertRaises(ValueError, pop.commit, id="main")
 
+    def test_should_commit_many(self):
+        with Population() as pop:
+            ids = pop.commit_many(["a", None, "c"])
+
+            self.assertEqual(len(ids), 3)
+            self.assertEqual(ids[0], "a")
+            self.assertEqual(ids[2], "c")
+            self.assertEqual(pop.head().id, "c")
+            self.assertEqual(pop.head().generation, 3)
+
+    def test_should_raise_commit_many_with_repeated_id(self):
+        with Population() as pop:
+            pop.commit(id="a")
+            self.assertRaises(ValueError, pop.commit_many, ["b", "a"])
+            self.assertFalse(pop.repo.exists("b"))
+
+    def test_should_raise_commit_many_with_mismatched_lengths(self):
+        with Population() as pop:
+            self.assertRaises(
+                ValueError, pop.commit_many, ["a", "b", "c"], timesteps=[5]
+            )
+
+            # Nothing from the rejected batch may have been written.
+            self.assertFalse(pop.repo.exists("a"))
+            self.assertEqual(pop.head().id, "_root")
+
+    def test_should_raise_commit_many_with_id_repeated_in_batch(self):
+        with Population() as pop:
+            self.assertRaises(ValueError, pop.commit_many, ["x", "y", "x"])
+
+            # Nothing from the rejected batch may have been written.
+            self.assertFalse(pop.repo.exists("x"))
+            self.assertFalse(pop.repo.exists("y"))
+            self.assertEqual(pop.head().id, "_root")
+
+    def test_detach_should_start_on_the_default_branch(self):
+        with Population() as pop:
+            pop.branch("b1")
+            pop.commit()
+
+            detached = pop.detach()
+
+            self.assertEqual(detached.branch(), "main")
+            self.assertEqual(detached.branches(), {"main"})
+            self.assertEqual(detached.checkout(detached.branch()), "main")
+            detached.commit()
+            self.assertNotIn("b1", detached.branches())
+
     def test_should_store_timestep(self):
         with Population() as pop:
             pop.commit(timestep=2)